@@ -25,13 +25,15 @@ Modules Used:
 
 import os
 import re
+import pandas as pd
 from dotenv import load_dotenv
 from dash import Dash
 import dash_bootstrap_components as dbc
 from dashboard.insights import get_overall_insights
-from data_engine.data_loader import load_and_prepare_data
+from data_engine.data_loader import load_and_prepare_data, preload_mappings
 
 from pages.generate_layout import generate_layout
+from callbacks.load_components import register_load_callbacks
 from callbacks.update_figures import register_callbacks
 
 from utils.performance import _log_execution_time
@@ -67,6 +69,8 @@ def initialize_dash_app():
             "https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0-beta3/css/all.min.css",
         ],
         title="ATHENA - Recruitment Analytics",
+        # Control panel components are rendered by a callback after page load
+        suppress_callback_exceptions=True,
     )
     app.server = app.server  # Flask server
     return app
@@ -78,6 +82,12 @@ def main():
     # Initialize app
     app = initialize_dash_app()
 
+    # Copy-on-Write: copies share their data until one of them is written to
+    pd.set_option("mode.copy_on_write", True)
+
+    # Load static mappings once, before any callback thread needs them
+    preload_mappings()
+
     # Load and process data
     extended_data_df = load_and_prepare_data()
 
@@ -117,9 +127,10 @@ def main():
     visualizations = (industries_fig, fields_fig, choropleth_fig, sankey_fig)
 
     # Set up layout with these initial figures
-    app.layout = generate_layout(extended_data_df, metrics, visualizations)
+    app.layout = generate_layout(visualizations)
 
-    # Register callbacks for interactive updates
+    # Register callbacks for the deferred components and interactive updates
+    register_load_callbacks(app, extended_data_df, metrics)
     register_callbacks(app, extended_data_df)
 
     # Run server
@@ -0,0 +1,29 @@
+from dash import ALL, Input, Output
+from dash.exceptions import PreventUpdate
+from dashboard.control_panel import generate_control_card
+
+
+def register_load_callbacks(app, df, metrics):
+    # Flag the page as ready as soon as the browser has rendered the initial layout
+    app.clientside_callback(
+        "function(children) { return true; }",
+        Output("page-ready", "data"),
+        Input("output-clientside", "children"),
+    )
+
+    @app.callback(
+        [
+            Output("control-card-slot", "children"),
+            Output({"type": "stats-value", "index": ALL}, "children"),
+        ],
+        Input("page-ready", "data"),
+    )
+    def load_components_callback(ready):
+        """
+        Render the control panel and fill in the stats card values after the page has loaded.
+        """
+        if not ready:
+            raise PreventUpdate
+
+        # Only the values are sent; the cards themselves are part of the layout
+        return generate_control_card(df), list(metrics)
@@ -1,4 +1,5 @@
 from dash import Input, Output, State, callback_context
+from dashboard.control_panel import get_countries
 from dashboard.data_visualizations import generate_figures
 
 
@@ -20,6 +21,8 @@ def register_callbacks(app, df):
             State("country-select", "value"),
             State("globe-select", "value"),
         ],
+        # The controls are rendered after page load; the initial figures are already in the layout
+        prevent_initial_call=True,
     )
     def update_figures_callback(
         apply_clicks, reset_clicks, ir_levels, selected_countries, selected_projection
@@ -37,7 +40,7 @@ def register_callbacks(app, df):
 
         default_dropdown_options = ["1st Node", "Field"] + status_cols
 
-        default_countries = df["Country"].unique()
+        default_countries = get_countries(df)
         default_projection = "natural earth1"
 
         # If the user clicked "Reset"
@@ -0,0 +1,42 @@
+"""
+Convert the raw applicants' data from CSV to Parquet.
+
+Reads `raw_data.csv` from OUTPUT_DIR with the known column dtypes and writes
+`raw_data.parquet` next to it, which `load_raw_data` then prefers. Requires pyarrow.
+
+Usage:
+    python convert_to_parquet.py
+"""
+
+import os
+
+import pandas as pd
+
+from data_engine.data_loader import OUTPUT_DIR, RAW_DTYPES
+
+from utils.performance import _log_execution_time
+
+
+@_log_execution_time
+def convert_to_parquet(output_dir=OUTPUT_DIR):
+    """
+    Convert `raw_data.csv` in the output directory to a zstd-compressed Parquet file.
+
+    Args:
+        output_dir (str): Directory containing `raw_data.csv` (default: OUTPUT_DIR).
+
+    Returns:
+        str: Path of the written Parquet file.
+    """
+    raw_data_filepath = os.path.join(output_dir, "raw_data.csv")
+    raw_parquet_filepath = os.path.join(output_dir, "raw_data.parquet")
+
+    raw_df = pd.read_csv(raw_data_filepath, dtype=RAW_DTYPES)
+    raw_df.to_parquet(
+        raw_parquet_filepath, engine="pyarrow", compression="zstd", index=False
+    )
+    return raw_parquet_filepath
+
+
+if __name__ == "__main__":
+    print(f"Raw data converted to {convert_to_parquet()}")
@@ -9,13 +9,16 @@ Components include:
 
 Functions:
     - description_card: Creates a card containing the dashboard title and description.
+    - get_countries: Returns the distinct countries of the data for the country filter.
     - generate_control_card: Creates a control panel for filtering data visualizations.
     - generate_stats_card: Creates a card for displaying a single statistic with an image.
 """
 
 from dash import html, dcc
 import dash_bootstrap_components as dbc
+import pandas as pd
 import re
+from functools import lru_cache
 
 from data_engine.data_loader import load_map_projections
 
@@ -25,6 +28,10 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Columns that are never offered as IRENE-Sankey levels
+_EXCLUDE_RE = re.compile(r"Position|Num|Has|Timestamp")
+_STATUS_LEVEL_RE = re.compile(r"StatusLevel(\d+)")
+
 
 @_log_execution_time
 def description_card():
@@ -65,39 +72,75 @@ def description_card():
     )
 
 
-@_log_execution_time
-def generate_control_card(df):
+@lru_cache(maxsize=8)
+def _ir_level_options(columns):
     """
-    Create a control panel for filtering data visualizations.
+    Build the IRENE-Sankey level options from the DataFrame columns.
+
+    Cached on the column names, which stay the same across renders.
 
     Args:
-        df (DataFrame): DataFrame containing data for dropdown options.
+        columns (tuple): Column names of the DataFrame.
 
     Returns:
-        html.Div: A Div containing the control panel for data visualizations.
+        tuple: A tuple containing:
+            - dropdown_options (tuple): All selectable levels, StatusLevels sorted numerically.
+            - default_dropdown_options (tuple): Levels selected by default.
     """
-
-    countries = df["Country"].unique()
-    columns_to_exclude_regex = r"Position|Num|Has|Timestamp"
-
     # find columns that match your pattern, e.g. StatusLevel\d+
-    possible_ir_levels = df.columns[~df.columns.str.contains(columns_to_exclude_regex)]
+    possible_ir_levels = [col for col in columns if not _EXCLUDE_RE.search(col)]
 
     # Sort the status levels numerically
     # (If you want them to appear in the dropdown in order)
     def sort_numeric_status(col):
-        match = re.search(r"StatusLevel(\d+)", col)
+        match = _STATUS_LEVEL_RE.search(col)
         return int(match.group(1)) if match else -1
 
     possible_ir_levels = sorted(possible_ir_levels, key=sort_numeric_status)
-    dropdown_options = ["1st Node"] + [col for col in possible_ir_levels]
+    dropdown_options = ("1st Node", *possible_ir_levels)
+
+    # Find all status-level columns, excluding StatusLevel0
+    status_cols = [
+        col
+        for col in columns
+        if col.startswith("StatusLevel") and col != "StatusLevel0"
+    ]
+    default_dropdown_options = ("1st Node", "Field", *status_cols)
+
+    return dropdown_options, default_dropdown_options
+
+
+def get_countries(df):
+    """
+    Return the distinct countries of the data for the country filter.
+
+    Args:
+        df (DataFrame): DataFrame containing a "Country" column.
 
-    # Find all status-level columns
-    status_cols = [col for col in df.columns if col.startswith("StatusLevel")]
-    # Exclude StatusLevel0
-    status_cols = [col for col in status_cols if col != "StatusLevel0"]
+    Returns:
+        list: The distinct country codes.
+    """
+    countries = df["Country"]
+    if isinstance(countries.dtype, pd.CategoricalDtype):
+        # The categories are already deduplicated, so the rows need no scan
+        return countries.cat.categories.tolist()
+    return countries.unique().tolist()
+
+
+@_log_execution_time
+def generate_control_card(df):
+    """
+    Create a control panel for filtering data visualizations.
 
-    default_dropdown_options = ["1st Node", "Field"] + status_cols
+    Args:
+        df (DataFrame): DataFrame containing data for dropdown options.
+
+    Returns:
+        html.Div: A Div containing the control panel for data visualizations.
+    """
+
+    countries = get_countries(df)
+    dropdown_options, default_dropdown_options = _ir_level_options(tuple(df.columns))
 
     globe_list = load_map_projections()
 
@@ -108,8 +151,8 @@ def generate_control_card(df):
             html.H6("IRENE-Sankey Levels"),
             dcc.Dropdown(
                 id="ir-level-select",
-                options=dropdown_options,
-                value=default_dropdown_options,
+                options=list(dropdown_options),
+                value=list(default_dropdown_options),
                 multi=True,
                 className="dark-dropdown",
             ),
@@ -117,7 +160,7 @@ def generate_control_card(df):
             html.H6("Select Country"),
             dcc.Dropdown(
                 id="country-select",
-                options=[{"label": i, "value": i} for i in countries],
+                options=countries,  # label == value, so plain strings suffice
                 value=countries,
                 multi=True,
                 className="dark-dropdown",
@@ -150,7 +193,7 @@ def generate_control_card(df):
 
 
 @_log_execution_time
-def generate_stats_card(title, value, image_path):
+def generate_stats_card(title, value, image_path, index=None):
     """
     Create a card for displaying a single statistic with an image.
 
@@ -158,17 +201,23 @@ def generate_stats_card(title, value, image_path):
         title (str): The title of the statistic.
         value (str): The value of the statistic.
         image_path (str): The file path to the image to display on the card.
+        index (int, optional): Gives the value the ID `{"type": "stats-value", "index": index}`,
+            so callbacks can update it alone (default: no ID).
 
     Returns:
         html.Div: A Div containing a Bootstrap card with the statistic and image.
     """
+    value_component = html.P(value, className="card-value")
+    if index is not None:
+        value_component.id = {"type": "stats-value", "index": index}
+
     return html.Div(
         dbc.Card(
             [
                 dbc.CardImg(src=image_path, top=True, className="card-img"),
                 dbc.CardBody(
                     [
-                        html.P(value, className="card-value"),
+                        value_component,
                         html.H4(title, className="card-title"),
                     ]
                 ),
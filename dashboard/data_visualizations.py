@@ -22,10 +22,27 @@ import irene_sankey as irs
 from utils.levels import reorder_and_place_status_levels
 
 
+def _value_counts(series):
+    """
+    Count the values of a Series, leaving out the unused categories that
+    categorical columns report with a zero count. The labels are returned as
+    plain values, since plotly would otherwise group by every category.
+    """
+    counts = series.value_counts()
+    counts = counts[counts > 0]
+    counts.index = counts.index.astype(object)
+    return counts
+
+
 def create_irene_sankey(data, levels, title, color_template, font_color):
     """
     Generate an IRENE-Sankey diagram for hierarchical flow data.
     """
+    # IRENE-Sankey writes suffixed labels into the level columns,
+    # which categorical columns would reject
+    category_columns = data.select_dtypes("category").columns
+    data = data.astype({col: "object" for col in category_columns})
+
     # Generate the flow data using IRENE-Sankey utilities
     flow_df, node_map, link = irs.traverse_sankey_flow(
         data, levels, head_node_label="Applications"
@@ -160,7 +177,7 @@ def generate_figures(
     and in the callback (with updated user selections).
     """
     # 1) TREEMAP: Top Industries
-    top_industries = df["Industry"].value_counts().reset_index(name="count")
+    top_industries = _value_counts(df["Industry"]).reset_index(name="count")
     fig_industries = create_treemap(
         data=top_industries,
         path=["Industry"],
@@ -172,7 +189,7 @@ def generate_figures(
     )
 
     # 2) BAR CHART: Top Fields
-    top_fields = df["Field"].value_counts().head(10).reset_index(name="count")
+    top_fields = _value_counts(df["Field"]).head(10).reset_index(name="count")
     total_count = top_fields["count"].sum()
     top_fields["percentage_and_count"] = (top_fields["count"] / total_count).apply(
         lambda x: f"{x:.2f}%"
@@ -192,7 +209,7 @@ def generate_figures(
     )
 
     # 3) CHOROPLETH: Top Countries (limit to top 30)
-    top_countries = df["Country"].value_counts().head(30).reset_index(name="count")
+    top_countries = _value_counts(df["Country"]).head(30).reset_index(name="count")
     top_countries.rename(columns={"index": "Country"}, inplace=True)
     fig_choropleth = create_choropleth(
         data=top_countries,
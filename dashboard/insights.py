@@ -1,3 +1,5 @@
+import numpy as np
+
 from utils.performance import _log_execution_time
 
 import logging
@@ -5,6 +7,28 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+def _status_bitmask(status):
+    """
+    Encode the status codes in a status string as a bitmask, one bit per letter.
+
+    Args:
+        status (str): Status string, e.g. "VIITO".
+
+    Returns:
+        int: Bitmask with bit 0 set for "A", bit 1 for "B", and so on.
+    """
+    bitmask = 0
+    for code in status:
+        if "A" <= code <= "Z":
+            bitmask |= 1 << (ord(code) - ord("A"))
+    return bitmask
+
+
+# Inactive and interview-related status codes
+_INACTIVE_MASK = _status_bitmask("NHGR")
+_INTERVIEW_MASK = _status_bitmask("IAT")
+
+
 @_log_execution_time
 def get_overall_insights(df):
     """
@@ -23,39 +47,23 @@ def get_overall_insights(df):
             - num_of_interviews (int): Number of applications with interview status ("I" in "Status").
     """
 
-    # Define inactive status codes
-    inactive_status = {"N", "H", "G", "R"}
-
-    # Ensure 'Status' column has no NaN values by replacing with an empty string
-    df["Status"] = df["Status"].fillna("")
-
-    # Check if the status contains any inactive codes
-    def is_active(status):
-        return not any(
-            char in inactive_status for char in str(status)
-        )  # Ensure status is a string
-
-    # Apply the function safely
-    df["isActive"] = df["Status"].apply(is_active)
-
-    # Define interview-related status codes
-    interview_status = {"I", "A", "T"}
-
-    # Function to check if a status includes any interview-related code
-    def has_interview(status):
-        return any(
-            char in interview_status for char in str(status)
-        )  # Ensure status is a string
+    # One bitmask per distinct status, gathered to the rows by category code;
+    # NaNs have code -1, which picks the trailing empty mask
+    status = df["Status"].astype("category")
+    bitmasks = np.array(
+        [_status_bitmask(codes) for codes in status.cat.categories] + [0]
+    )[status.cat.codes.to_numpy()]
 
-    # Apply the function safely
-    df["hasInterview"] = df["Status"].apply(has_interview)
+    # Active applications contain no inactive code
+    is_active = (bitmasks & _INACTIVE_MASK) == 0
+    has_interview = (bitmasks & _INTERVIEW_MASK) != 0
 
     num_of_applications = df.shape[0]
     num_of_countries = df["Country"].nunique()
     num_of_industries = df["Industry"].nunique()
     num_of_fields = df["Field"].nunique()
-    num_of_active = df["isActive"].sum()
-    num_of_interviews = df["hasInterview"].sum()
+    num_of_active = int(is_active.sum())
+    num_of_interviews = int(has_interview.sum())
 
     return (
         num_of_applications,
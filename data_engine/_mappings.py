@@ -0,0 +1,156 @@
+"""
+Module for Holding Static Mappings in Memory
+
+This module keeps the small, static mapping files used by the dashboard as
+module-level singletons. They are loaded once, either eagerly at app bootstrap
+via `init` or lazily on first access, behind a lock so concurrent Dash callback
+threads never read the files twice.
+
+Directories:
+    - MAPPING_DIR: Directory containing JSON and CSV mapping files.
+
+Globals:
+    - STATUS_MAPPING: Mapping of status codes to their descriptions.
+    - COMPANY_INDUSTRY: Mapping of companies to industries.
+    - POSITION_FIELD: Mapping of positions to fields.
+    - MAP_PROJECTIONS: List of available map projections.
+    - COUNTRIES_ISO: Country code mappings keyed by (abbr_from, abbr_to).
+
+Functions:
+    - init: Load all mappings into the module globals.
+    - get_countries_ISO: Return the country code mapping for a pair of ISO formats.
+
+Notes:
+    - The globals are shared across threads and must be treated as read-only.
+"""
+
+import os
+import csv
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.performance import _log_execution_time
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+# orjson parses JSON in C when it is installed, the stdlib json module otherwise
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Directory for mapping files
+MAPPING_DIR = os.getenv("MAPPING_DIR", "./data/mappings")
+
+_LOCK = threading.Lock()
+_initialized = False
+
+STATUS_MAPPING = {}
+COMPANY_INDUSTRY = {}
+POSITION_FIELD = {}
+MAP_PROJECTIONS = []
+COUNTRIES_ISO = {}
+
+
+def _read_json(filename):
+    """
+    Read a JSON file from the mapping directory.
+
+    Args:
+        filename (str): Name of the JSON file inside MAPPING_DIR.
+
+    Returns:
+        dict | list: The parsed JSON content.
+    """
+    filepath = os.path.join(MAPPING_DIR, filename)
+
+    if HAS_ORJSON:
+        with open(filepath, "rb") as file:
+            return orjson.loads(file.read())
+
+    with open(filepath, "r") as file:
+        return json.load(file)
+
+
+def _read_countries_ISO(abbr_from, abbr_to):
+    """
+    Read the country code mapping between two ISO formats from the CSV file.
+
+    Args:
+        abbr_from (str): The column name of the source ISO code format.
+        abbr_to (str): The column name of the target ISO code format.
+
+    Returns:
+        dict: A dictionary mapping country codes from `abbr_from` to `abbr_to`.
+    """
+    # A single csv pass is enough for two columns; "NA" (Namibia) stays a code
+    with open(os.path.join(MAPPING_DIR, "countries_ISO.csv"), newline="") as file:
+        return {row[abbr_from]: row[abbr_to] for row in csv.DictReader(file)}
+
+
+@_log_execution_time
+def init():
+    """
+    Load all mappings into the module globals.
+
+    Safe to call more than once and from several threads; the files are only
+    read on the first call. A missing company-industry or position-field file
+    leaves the corresponding mapping empty.
+    """
+    global _initialized
+
+    if _initialized:
+        return
+
+    with _LOCK:
+        if _initialized:
+            return
+
+        STATUS_MAPPING.update(_read_json("status.json"))
+        MAP_PROJECTIONS.extend(_read_json("map_projections.json"))
+
+        # The two largest files are read concurrently, as file I/O releases the GIL
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = {
+                executor.submit(_read_json, "company_industry.json"): COMPANY_INDUSTRY,
+                executor.submit(_read_json, "position_field.json"): POSITION_FIELD,
+            }
+            # A missing file only leaves its own mapping empty
+            for future, mapping in futures.items():
+                try:
+                    mapping.update(future.result())
+                except FileNotFoundError as e:
+                    print(f"Error: {e}")
+
+        COUNTRIES_ISO[("alpha-2", "alpha-3")] = _read_countries_ISO(
+            "alpha-2", "alpha-3"
+        )
+
+        _initialized = True
+
+
+def get_countries_ISO(abbr_from, abbr_to):
+    """
+    Return the country code mapping for a pair of ISO formats.
+
+    Args:
+        abbr_from (str): The column name of the source ISO code format.
+        abbr_to (str): The column name of the target ISO code format.
+
+    Returns:
+        dict: A dictionary mapping country codes from `abbr_from` to `abbr_to`.
+    """
+    init()
+
+    key = (abbr_from, abbr_to)
+    if key not in COUNTRIES_ISO:
+        with _LOCK:
+            if key not in COUNTRIES_ISO:
+                COUNTRIES_ISO[key] = _read_countries_ISO(abbr_from, abbr_to)
+
+    return COUNTRIES_ISO[key]
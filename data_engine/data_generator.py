@@ -10,8 +10,13 @@ Directories:
     - MAPPING_DIR: Directory containing mapping files in JSON format.
 
 Functions:
+    - log_missing_entry: Log a missing entry to a file for later review.
+    - log_missing_entries: Log a batch of missing entries in a single write.
+    - find_missing_companies: Find companies missing in the company-industry mapping.
+    - find_missing_positions: Find positions missing in the position-field mapping.
     - update_missing_company_industry: Identify companies missing industry in the company-industry mapping.
     - update_missing_position_field: Identify positions missing field in  the position-field mapping.
+    - compute_missing_mappings: Update both mappings with the entries missing for a dataset.
     - add_industry_and_field: Add "Industry" and "Field" columns to the dataset.
     - add_suffix_to_cross_column_duplicates: Add suffixes to duplicate values across columns.
     - add_missing_values: Introduce missing values (NaNs) into specific columns.
@@ -20,8 +25,8 @@ Functions:
 
 import os
 import json
-import re
 import numpy as np
+import pandas as pd
 
 from utils.performance import _log_execution_time
 
@@ -36,7 +41,6 @@ MISSING_ENTRIES_FILE = os.path.join(MAPPING_DIR, "missing_entries.log")
 PLACEHOLDER = "MISSING!!!"
 
 
-@_log_execution_time
 def log_missing_entry(entry_type, name):
     """
     Log missing entries to a file for later review.
@@ -45,9 +49,67 @@ def log_missing_entry(entry_type, name):
         entry_type (str): The type of missing entry (e.g., "Company", "Position").
         name (str): The name of the missing entry.
     """
+    log_missing_entries(entry_type, [name])
+
+
+@_log_execution_time
+def log_missing_entries(entry_type, names):
+    """
+    Log a batch of missing entries to a file for later review, in a single write.
+
+    Args:
+        entry_type (str): The type of missing entries (e.g., "Company", "Position").
+        names (list): The names of the missing entries.
+    """
+    if not names:
+        return
+
     with open(MISSING_ENTRIES_FILE, "a") as file:
-        file.write(f"{entry_type}: {name}\n")
-    print(f"Logged missing {entry_type.lower()}: '{name}' to {MISSING_ENTRIES_FILE}")
+        file.writelines(f"{entry_type}: {name}\n" for name in names)
+    for name in names:
+        print(
+            f"Logged missing {entry_type.lower()}: '{name}' to {MISSING_ENTRIES_FILE}"
+        )
+
+
+def find_missing_companies(raw_data_df, company_industry_mapping):
+    """
+    Find companies that are missing in the company-industry mapping.
+
+    Args:
+        raw_data_df (DataFrame): Job application data.
+        company_industry_mapping (dict): Existing mapping of companies to industries.
+
+    Returns:
+        list: Company names (without "xN" suffix) that have no industry, in
+            order of first appearance.
+    """
+    company_names = (
+        raw_data_df["Company"].drop_duplicates().str.replace(r"\sx\d+$", "", regex=True)
+    )
+    # Keep the first-seen order, so the missing entries are logged deterministically
+    return [
+        company
+        for company in dict.fromkeys(company_names)
+        if company not in company_industry_mapping
+    ]
+
+
+def find_missing_positions(raw_data_df, position_field_mapping):
+    """
+    Find positions that are missing in the position-field mapping.
+
+    Args:
+        raw_data_df (DataFrame): Job application data.
+        position_field_mapping (dict): Existing mapping of positions to fields.
+
+    Returns:
+        list: Positions that have no field, in order of first appearance.
+    """
+    positions = raw_data_df["Position"].drop_duplicates()
+    return [
+        position for position in positions if position not in position_field_mapping
+    ]
 
 
 @_log_execution_time
@@ -56,25 +118,24 @@ def update_missing_company_industry(df, company_industry_mapping):
     Update industries for companies missing in the company-industry mapping.
 
     Args:
-        df (DataFrame): Enriched job application data.
+        df (DataFrame): Job application data.
         company_industry_mapping (dict): Existing mapping of companies to industries.
 
     Returns:
-        dict: Updated company-industry mapping.
+        dict: Updated company-industry mapping, or the given mapping itself
+            if no company is missing.
     """
+    missing_companies = find_missing_companies(df, company_industry_mapping)
+    if not missing_companies:
+        # Nothing to add, so the mapping file is left as it is
+        return company_industry_mapping
+
     updated_mapping = company_industry_mapping.copy()
-    company_names = df["Company"].unique()
-
-    for company in company_names:
-        clean_company_name = re.sub(r"\sx\d+$", "", company)
-        if clean_company_name not in updated_mapping:
-            print(f"Industry for company '{clean_company_name}' is missing.")
-            log_missing_entry(
-                "ALERT - Missing industry for company", clean_company_name
-            )
-            updated_mapping[clean_company_name] = (
-                PLACEHOLDER  # Add placeholder for missing entry
-            )
+    for company in missing_companies:
+        print(f"Industry for company '{company}' is missing.")
+    log_missing_entries("ALERT - Missing industry for company", missing_companies)
+    # Add placeholders for missing entries
+    updated_mapping.update(dict.fromkeys(missing_companies, PLACEHOLDER))
 
     updated_filepath = os.path.join(MAPPING_DIR, "company_industry.json")
     with open(updated_filepath, "w") as file:
@@ -88,20 +149,24 @@ def update_missing_position_field(df, position_field_mapping):
     Update fields for positions missing in the position-field mapping.
 
     Args:
-        df (DataFrame): Enriched job application data.
+        df (DataFrame): Job application data.
         position_field_mapping (dict): Existing mapping of positions to fields.
 
     Returns:
-        dict: Updated position-field mapping.
+        dict: Updated position-field mapping, or the given mapping itself
+            if no position is missing.
     """
-    updated_mapping = position_field_mapping.copy()
-    job_positions = df["Position"].unique()
+    missing_positions = find_missing_positions(df, position_field_mapping)
+    if not missing_positions:
+        # Nothing to add, so the mapping file is left as it is
+        return position_field_mapping
 
-    for position in job_positions:
-        if position not in updated_mapping:
-            print(f"Field for position '{position}' is missing.")
-            log_missing_entry("ALERT - Missing field for position", position)
-            updated_mapping[position] = PLACEHOLDER  # Add placeholder for missing entry
+    updated_mapping = position_field_mapping.copy()
+    for position in missing_positions:
+        print(f"Field for position '{position}' is missing.")
+    log_missing_entries("ALERT - Missing field for position", missing_positions)
+    # Add placeholders for missing entries
+    updated_mapping.update(dict.fromkeys(missing_positions, PLACEHOLDER))
 
     updated_filepath = os.path.join(MAPPING_DIR, "position_field.json")
     with open(updated_filepath, "w") as file:
@@ -109,6 +174,55 @@ def update_missing_position_field(df, position_field_mapping):
     return updated_mapping
 
 
+@_log_execution_time
+def compute_missing_mappings(df, company_industry_mapping, position_field_mapping):
+    """
+    Update the company-industry and position-field mappings with missing entries.
+
+    Only the "Company" and "Position" columns are read, so the DataFrame does not
+    need to be enriched first.
+
+    Args:
+        df (DataFrame): Job application data.
+        company_industry_mapping (dict): Existing mapping of companies to industries.
+        position_field_mapping (dict): Existing mapping of positions to fields.
+
+    Returns:
+        tuple: A tuple containing two dictionaries:
+            - updated_company_industry_mapping (dict): Updated company-industry mapping.
+            - updated_position_field_mapping (dict): Updated position-field mapping.
+    """
+    updated_company_industry_mapping = update_missing_company_industry(
+        df, company_industry_mapping
+    )
+    updated_position_field_mapping = update_missing_position_field(
+        df, position_field_mapping
+    )
+    return updated_company_industry_mapping, updated_position_field_mapping
+
+
+def _map_categories(series, mapping, default="Unknown"):
+    """
+    Map the values of a Series through a dictionary, one lookup per category.
+
+    Args:
+        series (pd.Series): Values to map, ideally of categorical dtype.
+        mapping (dict): Mapping of values to their replacement.
+        default (str): Value for entries missing in the mapping, and for NaNs.
+
+    Returns:
+        np.ndarray: Object array with the mapped value of every row.
+    """
+    categorical = series.astype("category")
+    lookup = np.array(
+        [mapping.get(category, default) for category in categorical.cat.categories]
+        + [default],
+        dtype=object,
+    )
+    # NaNs have code -1, which picks the trailing default
+    return lookup[categorical.cat.codes.to_numpy()]
+
+
 @_log_execution_time
 def add_industry_and_field(
     raw_data_df, company_industry_mapping, position_field_mapping
@@ -122,18 +236,19 @@ def add_industry_and_field(
         position_field_mapping (dict): Mapping of positions to fields.
 
     Returns:
-        pd.DataFrame: Updated DataFrame with "Industry" and "Field" columns.
+        pd.DataFrame: Updated DataFrame with categorical "Industry" and "Field" columns.
     """
-    raw_data_df["Industry"] = (
-        raw_data_df["Company"].map(company_industry_mapping).fillna("Unknown")
+    raw_data_df["Industry"] = _map_categories(
+        raw_data_df["Company"], company_industry_mapping
     )
-    raw_data_df["Field"] = (
-        raw_data_df["Position"].map(position_field_mapping).fillna("Unknown")
+    raw_data_df["Field"] = _map_categories(
+        raw_data_df["Position"], position_field_mapping
     )
     processed_data_df = add_suffix_to_cross_column_duplicates(
         raw_data_df, ["Industry", "Field"], suffix="-x"
     )
-    return processed_data_df
+    # Categorize once the suffixes, which are new values, are in place
+    return processed_data_df.astype({"Industry": "category", "Field": "category"})
 
 
 @_log_execution_time
@@ -149,15 +264,17 @@ def add_suffix_to_cross_column_duplicates(df, columns, suffix="-x"):
     Returns:
         pd.DataFrame: DataFrame with updated values.
     """
-    for idx, row in df.iterrows():
-        seen = {}
-        for col in columns:
-            value = row[col]
-            if value not in seen:
-                seen[value] = 1
-            else:
-                seen[value] += 1
-                df.at[idx, col] = f"{value}{suffix}{seen[value]-1}"
+    # The n-th repeat of a value within a row gets "{value}{suffix}{n}", counting
+    # matches against the original values of the preceding columns
+    updates = {}
+    for i, col in enumerate(columns[1:], start=1):
+        repeats = sum((df[col] == df[prev]).astype(int) for prev in columns[:i])
+        mask = repeats > 0
+        if mask.any():
+            updates[col] = (mask, repeats[mask].astype(str))
+
+    for col, (mask, counts) in updates.items():
+        df.loc[mask, col] = df.loc[mask, col].astype(str) + suffix + counts
     return df
 
 
@@ -174,14 +291,25 @@ def add_missing_values(df, columns, missing_fraction=0.1):
     Returns:
         pd.DataFrame: DataFrame with missing values added.
     """
-    df_copy = df.copy()
-    for col in columns:
-        if col in df_copy.columns:
-            n_missing = (
-                int(len(df_copy) * missing_fraction)
-                if isinstance(missing_fraction, float)
-                else min(missing_fraction, len(df_copy))
-            )
-            missing_indices = np.random.choice(df_copy.index, n_missing, replace=False)
-            df_copy.loc[missing_indices, col] = np.nan
+    # Shallow copy; the columns written below are replaced rather than modified
+    # in place, so `df` is left untouched
+    df_copy = df.copy(deep=False)
+    present = [col for col in columns if col in df_copy.columns]
+    n_rows = len(df_copy)
+    n_missing = (
+        int(n_rows * missing_fraction)
+        if isinstance(missing_fraction, float)
+        else min(missing_fraction, n_rows)
+    )
+
+    # Draw distinct rows for every column at once: the first `n_missing` rows of
+    # a per-column random ordering
+    rng = np.random.default_rng()
+    missing_rows = rng.random((n_rows, len(present))).argsort(axis=0)[:n_missing]
+    mask = np.zeros((n_rows, len(present)), dtype=bool)
+    np.put_along_axis(mask, missing_rows, True, axis=0)
+
+    df_copy[present] = df_copy[present].mask(
+        pd.DataFrame(mask, index=df_copy.index, columns=present)
+    )
     return df_copy
@@ -7,30 +7,41 @@ and raw jobhunt data to facilitate easy data loading and processing.
 
 Directories:
     - APPLICATIONS_DIR: Directory containing job application folders.
-    - MAPPING_DIR: Directory containing JSON and CSV mapping files.
     - OUTPUT_DIR: Directory containing processed and raw jobhunt data.
 
 Functions:
     - parse_and_load_data: Parse data from the application directory or load pre-parsed data from the output directory.
+      Parsing is skipped when the pre-parsed data is still up to date.
     - load_map_projections: Load map projections from JSON file.
     - load_json_mappings: Load mappings between companies and industries, and positions and fields.
     - load_status_mapping: Load the mapping of job application statuses.
+    - preload_mappings: Load and cache all static mappings ahead of the first request.
     - extend_status_levels: Expand application statuses into multiple levels as separate columns.
     - load_countries_ISO: Load and map country codes between different ISO formats.
-    - load_raw_data: Load the raw applicants' data from a CSV file.
+    - load_raw_data: Load the raw applicants' data from a Parquet or CSV file.
     - load_and_prepare_data: Load and process application data.
 """
 
 import pandas as pd
 import os
 import json
+import hashlib
+from functools import lru_cache
+from types import MappingProxyType
 
+from data_engine import _mappings
 from data_engine.data_generator import (
-    update_missing_company_industry,
-    update_missing_position_field,
+    compute_missing_mappings,
     add_industry_and_field,
 )
-from data_engine.data_parser import parse_job_application_directory
+from data_engine.data_parser import (
+    HAS_PYARROW,
+    PARSE_CACHE_FILENAME,
+    PARSED_CATEGORIES,
+    folder_cache_key,
+    parse_job_application_directory,
+    save_parsed_data,
+)
 
 from utils.performance import _log_execution_time
 
@@ -38,43 +49,194 @@ import logging
 
 logger = logging.getLogger(__name__)
 
-# Directories for data and mappings
+# Directories for data; the mapping directory is read in `_mappings`
 APPLICATIONS_DIR = os.getenv("APPLICATIONS_DIR", "./data/job_applications")
-MAPPING_DIR = os.getenv("MAPPING_DIR", "./data/mappings")
 OUTPUT_DIR = os.getenv("OUTPUT_DIR", "./data/output")
 
+# Column dtypes of the applicants' data, so read_csv can skip type inference.
+# Low-cardinality text columns are categoricals: an int code per row plus the
+# distinct values once, which `.map` and `.unique` only have to visit once each.
+RAW_DTYPES = {
+    "Position": "category",
+    "Company": "category",
+    "Country": "category",
+    "NumApplications": "int32",
+    "HasCover": "bool",
+    "Status": "category",
+    "SubmissionTimestamp": "string",
+    "LastUpdateTimestamp": "string",
+}
+_CSV_ENGINE = "pyarrow" if HAS_PYARROW else "c"
+
+
+def _find_parsed_data(output_dir):
+    """
+    Find previously saved parsed data in the output directory.
+
+    Args:
+        output_dir (str): Path to the directory where parsed data is stored.
+
+    Returns:
+        str | None: Path of `parsed_data.parquet` (preferred when pyarrow is available)
+            or `parsed_data.csv`, or None if neither exists.
+    """
+    parquet_filepath = os.path.join(output_dir, "parsed_data.parquet")
+    csv_filepath = os.path.join(output_dir, "parsed_data.csv")
+
+    if HAS_PYARROW and os.path.exists(parquet_filepath):
+        return parquet_filepath
+    if os.path.exists(csv_filepath):
+        return csv_filepath
+    return None
+
+
+def _read_parsed_data(parsed_data_filepath):
+    """
+    Read saved parsed data from a Parquet or CSV file.
+
+    Args:
+        parsed_data_filepath (str): Path of the saved parsed data.
+
+    Returns:
+        pandas.DataFrame: The loaded data as a DataFrame.
+    """
+    print(f"Loading data from OUTPUT_DIR: {parsed_data_filepath}")
+    if parsed_data_filepath.endswith(".parquet"):
+        return pd.read_parquet(parsed_data_filepath).astype(PARSED_CATEGORIES)
+    return pd.read_csv(parsed_data_filepath, dtype=RAW_DTYPES, engine=_CSV_ENGINE)
+
+
+def _applications_fingerprint(applications_dir):
+    """
+    Hash the names and cache keys of the application folders.
+
+    Each folder is hashed with the same `folder_cache_key` the parse cache uses:
+    its mtime, which changes when files inside it are added, removed or renamed,
+    and the ctime of its `job_description.txt`, which changes when that file is
+    rewritten. Renaming a folder (e.g. a status update) changes its name. Edits
+    to other files that keep the folder's mtime, such as rewriting a cover letter
+    in place, do not change the hash, but they do not change the parsed data
+    either.
+
+    Args:
+        applications_dir (str): Path to the directory containing application folders.
+
+    Returns:
+        str: Hex digest of the directory listing.
+    """
+    digest = hashlib.sha256()
+    with os.scandir(applications_dir) as entries:
+        for entry in sorted(entries, key=lambda entry: entry.name):
+            mtime_ns, ctime_ns = folder_cache_key(entry)
+            digest.update(f"{entry.name}\0{mtime_ns}\0{ctime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def _is_parsed_data_fresh(applications_dir, parsed_data_filepath, meta_filepath):
+    """
+    Check whether saved parsed data still reflects the application directory.
+
+    Args:
+        applications_dir (str): Path to the directory containing application folders.
+        parsed_data_filepath (str | None): Path of the saved parsed data, if any.
+        meta_filepath (str): Path of the sidecar file holding the fingerprint.
+
+    Returns:
+        bool: True if the saved data is newer than the directory and its
+            fingerprint matches the current directory listing.
+    """
+    if not parsed_data_filepath or not os.path.exists(meta_filepath):
+        return False
+
+    parsed_stat = os.stat(parsed_data_filepath)
+    if parsed_stat.st_size == 0:
+        return False
+    if parsed_stat.st_mtime <= os.stat(applications_dir).st_mtime:
+        return False
+
+    # A corrupt or truncated sidecar only means the data has to be parsed again
+    try:
+        with open(meta_filepath, "r") as file:
+            meta = json.load(file)
+    except (OSError, ValueError):
+        return False
+
+    if meta.get("source") != os.path.basename(parsed_data_filepath):
+        return False
+    return meta.get("fingerprint") == _applications_fingerprint(applications_dir)
+
+
+def _write_parsed_data_meta(meta_filepath, meta):
+    """
+    Write the sidecar file of the parsed data atomically.
+
+    The content goes to a temporary file first, which then replaces the sidecar,
+    so an interrupted write never leaves a truncated file behind.
+
+    Args:
+        meta_filepath (str): Path of the sidecar file.
+        meta (dict): Source file name and fingerprint of the parsed data.
+    """
+    tmp_filepath = f"{meta_filepath}.tmp"
+    with open(tmp_filepath, "w") as file:
+        json.dump(meta, file, indent=4)
+    os.replace(tmp_filepath, meta_filepath)
+
 
 @_log_execution_time
-def parse_and_load_data(applications_dir, output_dir):
+def parse_and_load_data(applications_dir, output_dir, persist=True):
     """
     Parse data from the application directory or load pre-parsed data from the output directory.
 
-    This function checks if `applications_dir` exists and is non-empty. If so, it parses the data,
-    overwrites the existing `parsed_data.csv` in `output_dir`, and returns the parsed data.
-    Otherwise, it loads the data from `parsed_data.csv` in `output_dir` if it exists.
+    This function checks if `applications_dir` exists and is non-empty. If so, it parses the data
+    and returns the parsed DataFrame directly, saving a copy to `output_dir` when `persist` is True.
+    Parsing is skipped when the saved copy is newer than `applications_dir` and the fingerprint
+    in `parsed_data.meta.json` still matches its folders. When persisting, folders unchanged since
+    the previous parse are read from `.parse_cache.json` in `output_dir` instead of being parsed again.
+    Otherwise, it loads the data from `parsed_data.parquet` (or `parsed_data.csv`) in `output_dir`.
 
     Args:
         applications_dir (str): Path to the directory containing application files to parse.
         output_dir (str): Path to the directory where parsed data is stored.
+        persist (bool): Whether to save freshly parsed data to `output_dir` (default: True).
 
     Returns:
         pandas.DataFrame: The parsed or loaded data as a DataFrame.
 
     Raises:
-        FileNotFoundError: If neither `applications_dir` contains data nor `output_dir/parsed_data.csv` exists.
+        FileNotFoundError: If neither `applications_dir` contains data nor parsed data exists in `output_dir`.
     """
 
-    parsed_data_filepath = os.path.join(output_dir, "parsed_data.csv")
+    parsed_data_filepath = _find_parsed_data(output_dir)
+    meta_filepath = os.path.join(output_dir, "parsed_data.meta.json")
 
-    if os.path.exists(applications_dir):
-        if os.listdir(applications_dir):
-            print(f"Parsing data from APPLICATION_DIR: {applications_dir}")
-            parsed_df = parse_job_application_directory(applications_dir)
-            print(f"Data has been parsed from: {parsed_data_filepath}")
+    if os.path.isdir(applications_dir) and os.listdir(applications_dir):
+        if _is_parsed_data_fresh(applications_dir, parsed_data_filepath, meta_filepath):
+            return _read_parsed_data(parsed_data_filepath)
 
-    elif os.path.exists(parsed_data_filepath):
-        print(f"Loading data from OUTPUT_DIR: {parsed_data_filepath}")
-        parsed_df = pd.read_csv(parsed_data_filepath)
+        # Fingerprint before parsing, so changes made meanwhile trigger a re-parse
+        fingerprint = _applications_fingerprint(applications_dir)
+
+        print(f"Parsing data from APPLICATION_DIR: {applications_dir}")
+        # Folders unchanged since the last parse are taken from the parse cache
+        parsed_df = parse_job_application_directory(
+            applications_dir,
+            cache_filepath=(
+                os.path.join(output_dir, PARSE_CACHE_FILENAME) if persist else None
+            ),
+        )
+        if persist and not parsed_df.empty:
+            saved_filepath = save_parsed_data(parsed_df, output_dir)
+            _write_parsed_data_meta(
+                meta_filepath,
+                {
+                    "source": os.path.basename(saved_filepath),
+                    "fingerprint": fingerprint,
+                },
+            )
+
+    elif parsed_data_filepath:
+        parsed_df = _read_parsed_data(parsed_data_filepath)
 
     else:
         raise FileNotFoundError(
@@ -84,23 +246,24 @@ def parse_and_load_data(applications_dir, output_dir):
     return parsed_df
 
 
+@lru_cache(maxsize=None)
 @_log_execution_time
 def load_map_projections():
     """
     Load map projections from JSON file.
 
     Returns:
-        map_projections (list)
-    """
-    map_projections_filepath = os.path.join(MAPPING_DIR, "map_projections.json")
+        map_projections (tuple)
 
-    # Load the list from the JSON file
-    with open(map_projections_filepath, "r") as file:
-        map_projections = json.load(file)
+    Notes:
+        - The result is cached; repeated calls return the same tuple.
+    """
+    _mappings.init()
 
-    return map_projections
+    return tuple(_mappings.MAP_PROJECTIONS)
 
 
+@lru_cache(maxsize=None)
 @_log_execution_time
 def load_json_mappings():
     """
@@ -110,20 +273,18 @@ def load_json_mappings():
         tuple: A tuple containing two dictionaries:
             - company_industry_mapping (dict): Mapping of companies to industries.
             - position_field_mapping (dict): Mapping of positions to fields.
-    """
-    try:
-        with open(os.path.join(MAPPING_DIR, "company_industry.json"), "r") as file:
-            company_industry_mapping = json.load(file)
-        with open(os.path.join(MAPPING_DIR, "position_field.json"), "r") as file:
-            position_field_mapping = json.load(file)
 
-    except FileNotFoundError as e:
-        print(f"Error: {e}")
-        return {}, {}
+    Notes:
+        - The result is cached; the mappings are read-only views of shared dictionaries.
+    """
+    _mappings.init()
 
-    return company_industry_mapping, position_field_mapping
+    return MappingProxyType(_mappings.COMPANY_INDUSTRY), MappingProxyType(
+        _mappings.POSITION_FIELD
+    )
 
 
+@lru_cache(maxsize=None)
 @_log_execution_time
 def load_status_mapping():
     """
@@ -131,13 +292,25 @@ def load_status_mapping():
 
     Returns:
         dict: A dictionary mapping application statuses to their descriptions or codes.
+
+    Notes:
+        - The result is cached; the mapping is a read-only view of a shared dictionary.
     """
-    status_mapping_filepath = os.path.join(MAPPING_DIR, "status.json")
+    _mappings.init()
 
-    with open(status_mapping_filepath, "r") as file:
-        status_mapping = json.load(file)
+    return MappingProxyType(_mappings.STATUS_MAPPING)
 
-    return status_mapping
+
+@_log_execution_time
+def preload_mappings():
+    """
+    Load and cache all static mappings, so the first dashboard request is served warm.
+    """
+    _mappings.init()
+    load_map_projections()
+    load_json_mappings()
+    load_status_mapping()
+    load_countries_ISO()
 
 
 @_log_execution_time
@@ -153,25 +326,33 @@ def extend_status_levels(df, include_suffix_for=["Interview"]):
         pd.DataFrame: DataFrame with expanded status levels.
     """
     mapping = load_status_mapping()
-    max_levels = df["Status"].dropna().apply(len).max() + 1
-
-    for i in range(max_levels):
-        df[f"StatusLevel{i}"] = None
 
-    for idx, row in df.iterrows():
-        status_string = row["Status"] if isinstance(row["Status"], str) else ""
+    def status_levels(status_string):
         levels = (
             ["Submitted"] + [mapping.get(char, "NA") for char in status_string]
             if status_string
             else ["Submitted", "No Reply"]
         )
-        for i, level in enumerate(levels):
-            df.at[idx, f"StatusLevel{i}"] = (
-                f"{level}-R{i}" if level in include_suffix_for else level
-            )
+        return [
+            f"{level}-R{i}" if level in include_suffix_for else level
+            for i, level in enumerate(levels)
+        ]
+
+    # Expand each distinct status once, then broadcast the levels to every row
+    statuses = df["Status"].astype(object).fillna("")
+    unique_statuses = statuses.unique()
+    levels_by_status = pd.DataFrame(
+        [status_levels(status) for status in unique_statuses], index=unique_statuses
+    )
+    levels_df = levels_by_status.reindex(statuses.to_numpy())
+
+    # Levels are drawn from the small set of status descriptions
+    for i in levels_df.columns:
+        df[f"StatusLevel{i}"] = pd.Categorical(levels_df[i].to_numpy())
     return df
 
 
+@lru_cache(maxsize=None)
 @_log_execution_time
 def load_countries_ISO(abbr_from: str = "alpha-2", abbr_to: str = "alpha-3"):
     """
@@ -183,31 +364,33 @@ def load_countries_ISO(abbr_from: str = "alpha-2", abbr_to: str = "alpha-3"):
 
     Returns:
         dict: A dictionary mapping country codes from the `abbr_from` format to the `abbr_to` format.
-    """
-    # Path to the countries_ISO.csv file
-    countries_ISO_filepath = os.path.join(MAPPING_DIR, "countries_ISO.csv")
 
-    # Load the CSV file into a pandas DataFrame
-    countries_ISO_df = pd.read_csv(countries_ISO_filepath)
-
-    # Create a dictionary that maps abbr_from to abbr_to (e.g., alpha-2 to alpha-3)
-    country_mapping = dict(zip(countries_ISO_df[abbr_from], countries_ISO_df[abbr_to]))
-
-    return country_mapping
+    Notes:
+        - The result is cached; the mapping is a read-only view of a shared dictionary.
+    """
+    return MappingProxyType(_mappings.get_countries_ISO(abbr_from, abbr_to))
 
 
 @_log_execution_time
 def load_raw_data():
     """
-    Load the raw applicants' data from a CSV file.
+    Load the raw applicants' data from a Parquet or CSV file.
 
     Returns:
         pandas.DataFrame: A DataFrame containing the raw applicants' data.
+
+    Notes:
+        - `raw_data.parquet` (see `convert_to_parquet.py`) is preferred when pyarrow
+          is available, as it skips text parsing entirely. Otherwise `raw_data.csv` is read.
     """
+    raw_parquet_filepath = os.path.join(OUTPUT_DIR, "raw_data.parquet")
+    if HAS_PYARROW and os.path.exists(raw_parquet_filepath):
+        return pd.read_parquet(raw_parquet_filepath)
+
     raw_data_filepath = os.path.join(OUTPUT_DIR, "raw_data.csv")
 
     # Load the CSV file into a DataFrame
-    raw_df = pd.read_csv(raw_data_filepath)
+    raw_df = pd.read_csv(raw_data_filepath, dtype=RAW_DTYPES, engine=_CSV_ENGINE)
 
     return raw_df
 
@@ -219,18 +402,15 @@ def load_and_prepare_data():
     parsed_df = parse_and_load_data(APPLICATIONS_DIR, OUTPUT_DIR)
     company_industry_mapping, position_field_mapping = load_json_mappings()
 
-    # Enrich and update data
-    enriched_df = add_industry_and_field(
+    # Fill in missing mappings, then enrich the data in a single pass
+    (
+        updated_company_industry_mapping,
+        updated_position_field_mapping,
+    ) = compute_missing_mappings(
         parsed_df, company_industry_mapping, position_field_mapping
     )
-    updated_company_industry_mapping = update_missing_company_industry(
-        enriched_df, company_industry_mapping
-    )
-    updated_position_field_mapping = update_missing_position_field(
-        enriched_df, position_field_mapping
-    )
     updated_data_df = add_industry_and_field(
-        enriched_df,
+        parsed_df,
         updated_company_industry_mapping,
         updated_position_field_mapping,
     )
@@ -12,14 +12,23 @@ Directories:
 
 Functions:
     - extract_job_details: Extract job title, company, country, and status from folder names.
-    - format_timestamp: Convert timestamps into a readable date-time format.
-    - parse_jobhunt_directory: Parse the jobhunt directory and create a DataFrame of job details.
+    - format_timestamps: Convert timestamps into a readable date-time format.
+    - folder_cache_key: Key telling whether a parsed folder has changed since.
+    - load_parse_cache: Load the cache of previously parsed folders.
+    - save_parse_cache: Persist the cache of previously parsed folders.
+    - iter_job_application_directory: Parse the jobhunt directory in chunks of job details.
+    - parse_job_application_directory: Parse the jobhunt directory and create a DataFrame of job details.
+    - save_parsed_data: Persist parsed job details to the output directory.
+    - save_parsed_data_chunks: Stream chunks of parsed job details to the output directory.
 """
 
 import re
 import os
+import sys
+import json
 import pandas as pd
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from dateutil.tz import tzlocal
 
 from utils.performance import _log_execution_time
 
@@ -27,12 +36,91 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Parquet output is used when pyarrow is installed, CSV otherwise
+try:
+    import pyarrow as pa
+
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
 # Define directories
 APPLICATIONS_DIR = "./data/job_applications"
 OUTPUT_DIR = "./data/output"
 
+# Cache of parsed folders kept next to the parsed data, see `load_parse_cache`
+PARSE_CACHE_FILENAME = ".parse_cache.json"
+# Bumped whenever the cached rows would be laid out or parsed differently
+_PARSE_CACHE_VERSION = 4
+
+# Worker threads for the I/O-bound directory walk
+MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Write buffer for CSV output, so large files take fewer write calls
+CSV_BUFFER_SIZE = 1 << 20  # 1 MiB
+
+# Columns of the parsed job details
+PARSED_COLUMNS = [
+    "Position",
+    "Company",
+    "Country",
+    "NumApplications",
+    "HasCover",
+    "Status",
+    "SubmissionTimestamp",
+    "LastUpdateTimestamp",
+]
+# Dtypes of each parsed chunk. Categoricals are only applied to the full frame,
+# as chunks with different categories would not concatenate or stream as such.
+PARSED_DTYPES = {
+    "Position": "string",
+    "Company": "string",
+    "Country": "string",
+    "NumApplications": "int32",
+    "HasCover": "bool",
+    "Status": "string",
+    "SubmissionTimestamp": "string",
+    "LastUpdateTimestamp": "string",
+}
+# Columns of the full parsed frame stored as categoricals
+PARSED_CATEGORIES = {
+    "Position": "category",
+    "Company": "category",
+    "Country": "category",
+    "Status": "category",
+}
+
+if HAS_PYARROW:
+    _PARQUET_SCHEMA = pa.schema(
+        [
+            ("Position", pa.string()),
+            ("Company", pa.string()),
+            ("Country", pa.string()),
+            ("NumApplications", pa.int32()),
+            ("HasCover", pa.bool_()),
+            ("Status", pa.string()),
+            ("SubmissionTimestamp", pa.string()),
+            ("LastUpdateTimestamp", pa.string()),
+        ]
+    )
+
+
+# File extensions stripped from entry names before parsing
+_FILE_EXTENSIONS = (".txt", ".pdf", ".md")
+
+# "JobTitle - CompanyName [CountryCode] (Status)", country and status optional
+_DIR_RE = re.compile(
+    r"(?P<title>(?:(?! - ).)+?) - "
+    r"(?P<company>(?:(?! - )[^\[\]()])+?)\s*"
+    r"(?:\[(?P<country>[^\]]*)\])?\s*"
+    r"(?:\((?P<status>[^)]*)\))?\s*"
+)
+
+# Number of applications to the same company, given as an "xN" suffix
+_XN_SEARCH = re.compile(r"x(\d+)")
+_XN_STRIP = re.compile(r"\sx\d+$")
+
 
-@_log_execution_time
 def extract_job_details(dirname):
     """
     Extract job details (title, company, country, status) from a directory name.
@@ -53,62 +141,301 @@ def extract_job_details(dirname):
             "JobTitle - CompanyName [CountryCode] (Status)".
         - If the format is invalid, the function returns None.
     """
-    # Remove the file extension if any (e.g., .txt, .pdf)
-    dirname = dirname.rsplit(".", 1)[0]
+    # Remove a known file extension, keeping dots in names such as "Booking.com"
+    if dirname.endswith(_FILE_EXTENSIONS):
+        dirname = dirname.rsplit(".", 1)[0]
+
+    match = _DIR_RE.fullmatch(dirname)
+    if not match:
+        print(f"Error extracting details from '{dirname}': Invalid format")
+        return None
+
+    country_code = match["country"]
+    return (
+        match["title"].strip(),
+        match["company"].strip(),
+        country_code if country_code is not None else "NL",
+        match["status"] or "",
+    )
+
+
+def format_timestamps(timestamps):
+    """
+    Convert Unix timestamps into a human-readable local date-time format.
+
+    Args:
+        timestamps (pandas.Series): Unix timestamps in nanoseconds; missing values stay missing.
+
+    Returns:
+        pandas.Series: Formatted date-time strings in the format "YYYY-MM-DD HH:MM:SS".
+    """
+    return (
+        pd.to_datetime(timestamps, unit="ns", utc=True)
+        .dt.tz_convert(tzlocal())
+        .dt.strftime("%Y-%m-%d %H:%M:%S")
+    )
+
+
+def _to_frame(job_data):
+    """
+    Build a DataFrame of job details from a list of parsed rows.
+
+    The raw timestamps of the rows are formatted here, for the whole chunk at once.
+
+    Args:
+        job_data (list): Tuples of job details in the order of `PARSED_COLUMNS`,
+            with raw Unix timestamps in nanoseconds.
+
+    Returns:
+        pandas.DataFrame: A DataFrame with the dtypes of `PARSED_DTYPES`, so
+            chunks share one schema and can be concatenated or streamed to disk.
+    """
+    # Object columns skip dtype inference, which would turn the nanosecond
+    # timestamps into imprecise floats as soon as one of them is missing
+    job_data_df = pd.DataFrame(job_data, columns=PARSED_COLUMNS, dtype=object)
+    for col in ("SubmissionTimestamp", "LastUpdateTimestamp"):
+        job_data_df[col] = format_timestamps(job_data_df[col])
+    return job_data_df.astype(PARSED_DTYPES)
+
+
+def _has_cover(files):
+    """
+    Check whether a job application folder contains a cover letter.
 
+    Args:
+        files (Iterable[os.DirEntry]): Entries of the folder; consumption stops at
+            the first cover letter found.
+
+    Returns:
+        bool: True if a file name mentions "cover" or "motivation".
+    """
+    for file in files:
+        filename = file.name.lower()
+        if "cover" in filename or "motivation" in filename:
+            return True
+    return False
+
+
+def _parse_entry(entry):
+    """
+    Parse a single job application folder.
+
+    Only reads from the filesystem and touches no shared state, so it can run
+    concurrently across worker threads.
+
+    Args:
+        entry (os.DirEntry): Entry of the directory containing job application folders.
+
+    Returns:
+        tuple: Job details in the order of `PARSED_COLUMNS`.
+        None: If the entry is not a folder or its name does not conform to the expected format.
+    """
+    # The file type comes with the directory listing, so this needs no stat call
+    if not entry.is_dir():
+        return None
+
+    dirname = entry.name
+    dirpath = entry.path
+    details = extract_job_details(dirname)
+    if not details:
+        print(f"Skipping directory: {dirname}")
+        return None
+
+    job_title, company, country, status = details
+
+    # Extract number of applications
+    num_applications_match = _XN_SEARCH.search(company)
+    num_applications = (
+        int(num_applications_match.group(1)) if num_applications_match else 1
+    )
+    company = _XN_STRIP.sub("", company)  # Remove "xN" suffix from company name
+
+    # Check for cover letter
+    with os.scandir(dirpath) as files:
+        has_cover = _has_cover(files)
+
+    # Extract raw timestamps, formatted per chunk in `_to_frame`; a single stat
+    # call also tells whether the file exists
     try:
-        dirname = dirname.rsplit(".", 1)[0]
-        country_code = re.search(r"\[(.*?)\]", dirname)
-        status = re.search(r"\((.*?)\)", dirname)
-        job_and_company = re.split(
-            r" - ", re.sub(r"\[.*?\]|\(.*?\)", "", dirname).strip()
-        )
-
-        if len(job_and_company) != 2:
-            raise ValueError(f"Invalid format for: {dirname}")
-
-        job_title, company = map(str.strip, job_and_company)
-        return (
-            job_title,
-            company,
-            country_code.group(1) if country_code else "NL",
-            status.group(1) if status else "",
-        )
-    except Exception as e:
-        print(f"Error extracting details from '{dirname}': {e}")
+        job_description_stat = os.stat(os.path.join(dirpath, "job_description.txt"))
+        submission_timestamp = job_description_stat.st_ctime_ns
+    except FileNotFoundError:
+        submission_timestamp = None
+
+    last_update_timestamp = entry.stat().st_mtime_ns
+    if not status or status.lower() == "s":
+        last_update_timestamp = None
+
+    return (
+        job_title,
+        company,
+        country,
+        num_applications,
+        has_cover,
+        status,
+        submission_timestamp,
+        last_update_timestamp,
+    )
+
+
+def folder_cache_key(entry):
+    """
+    Build the key telling whether a job application folder has changed since it
+    was parsed.
+
+    A folder's mtime changes when files inside it are added, removed or renamed.
+    Rewriting `job_description.txt` in place leaves it untouched but changes the
+    file's ctime, which the parsed row stores as SubmissionTimestamp.
+
+    Args:
+        entry (os.DirEntry): Entry of the directory containing job application folders.
+
+    Returns:
+        list: `[mtime_ns, ctime_ns]` of the entry and its `job_description.txt`;
+            `ctime_ns` is None if the file is missing or the entry is not a folder.
+    """
+    try:
+        job_description_stat = os.stat(os.path.join(entry.path, "job_description.txt"))
+        ctime_ns = job_description_stat.st_ctime_ns
+    except (FileNotFoundError, NotADirectoryError):
+        ctime_ns = None
+    return [entry.stat().st_mtime_ns, ctime_ns]
+
+
+def _parse_cached_entry(entry, cached):
+    """
+    Parse a single job application folder, reusing its cached row when neither
+    the folder nor its `job_description.txt` has changed since.
+
+    Entries are keyed by `folder_cache_key`, and renaming a folder (e.g. a status
+    update) gives it a new cache entry.
+
+    Like `_parse_entry`, touches no shared state: the caller looks up `cached`
+    and stores the returned key and row.
+
+    Args:
+        entry (os.DirEntry): Entry of the directory containing job application folders.
+        cached (list, optional): The folder's `[key, row]` cache entry, if any.
+
+    Returns:
+        tuple: `(name, key, row)`, where `key` is the folder's `folder_cache_key`
+            and `row` holds the job details in the order of `PARSED_COLUMNS`, or None if the name
+            does not conform to the expected format.
+        None: If the entry is not a folder.
+    """
+    if not entry.is_dir():
         return None
 
+    key = folder_cache_key(entry)
+    if cached and cached[0] == key:
+        row = cached[1]
+    else:
+        row = _parse_entry(entry)
+    return entry.name, key, row
+
 
-@_log_execution_time
-def format_timestamp(timestamp):
+def load_parse_cache(cache_filepath):
     """
-    Convert a Unix timestamp into a human-readable date-time format.
+    Load the parse cache written by `save_parse_cache`.
 
     Args:
-        timestamp (float): Unix timestamp.
+        cache_filepath (str): Path of the parse cache file.
 
     Returns:
-        str: Formatted date-time string in the format "YYYY-MM-DD HH:MM:SS".
+        dict: Mapping of folder names to `[key, row]`; empty if the file is
+            missing, unreadable or written in an older format.
     """
-    return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
+    try:
+        with open(cache_filepath, "r") as file:
+            cache = json.load(file)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+    if cache.get("version") != _PARSE_CACHE_VERSION:
+        return {}
+    return cache["folders"]
+
+
+def save_parse_cache(cache, cache_filepath):
+    """
+    Persist the parse cache, so unchanged folders are not parsed again on the next run.
+
+    Args:
+        cache (dict): Mapping of folder names to `[key, row]`.
+        cache_filepath (str): Path of the parse cache file.
+    """
+    with open(cache_filepath, "w") as file:
+        json.dump({"version": _PARSE_CACHE_VERSION, "folders": cache}, file)
+
+
+def iter_job_application_directory(directory, chunk_size=10_000, cache=None):
+    """
+    Parse a directory of job application folders in chunks.
+
+    The folders are parsed on a thread pool: the work is dominated by filesystem
+    metadata calls, which release the GIL.
+
+    Args:
+        directory (str): Path to the directory containing job application folders.
+        chunk_size (int): Maximum number of folders per chunk (default: 10,000).
+        cache (dict, optional): Parse cache as loaded by `load_parse_cache`. Rows of
+            unmodified folders are taken from it, and it is updated in place with
+            the others; folders that no longer exist are dropped from it.
+
+    Yields:
+        pandas.DataFrame: Job details for up to `chunk_size` folders, with the
+            columns described in `parse_job_application_directory`.
+    """
+    with os.scandir(directory) as it:
+        entries = list(it)
+
+    if cache is not None:
+        for dirname in cache.keys() - {entry.name for entry in entries}:
+            del cache[dirname]
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        for start in range(0, len(entries), chunk_size):
+            chunk = entries[start : start + chunk_size]
+            if cache is None:
+                rows = executor.map(_parse_entry, chunk)
+            else:
+                rows = []
+                cached = [cache.get(entry.name) for entry in chunk]
+                # Merged here, on the calling thread, so workers never write the cache
+                for result in executor.map(_parse_cached_entry, chunk, cached):
+                    if result is None:
+                        continue
+                    name, key, row = result
+                    cache[name] = [key, row]
+                    rows.append(tuple(row) if row else None)
+            job_data = [row for row in rows if row is not None]
+            if job_data:
+                yield _to_frame(job_data)
 
 
 @_log_execution_time
-def parse_job_application_directory(directory):
+def parse_job_application_directory(
+    directory, persist=False, chunk_size=None, cache_filepath=None
+):
     """
     Parse a directory of job application folders to extract relevant details.
 
     Args:
         directory (str): Path to the directory containing job application folders.
+        persist (bool): Whether to save the parsed data to OUTPUT_DIR (default: False).
+        chunk_size (int, optional): Number of folders parsed per chunk. Smaller
+            chunks bound the memory used by intermediate rows (default: all at once).
+        cache_filepath (str, optional): Path of a parse cache file. When given, only
+            folders modified since the previous run are parsed (default: no cache).
 
     Returns:
         pandas.DataFrame: A DataFrame containing job details with the following columns:
-            - Position (str): Title of the job.
-            - Company (str): Name of the company.
-            - Country (str): Country code (e.g., "NL" or "USA").
-            - NumApplications (int): Number of applications submitted.
+            - Position (category): Title of the job.
+            - Company (category): Name of the company.
+            - Country (category): Country code (e.g., "NL" or "USA").
+            - NumApplications (int32): Number of applications submitted.
             - HasCover (bool): Whether a cover letter exists in the folder.
-            - Status (str): Application status.
+            - Status (category): Application status.
             - SubmissionTimestamp (str): Timestamp of submission.
             - LastUpdateTimestamp (str): Timestamp of the last update.
 
@@ -116,84 +443,99 @@ def parse_job_application_directory(directory):
         - The function checks for specific file and folder structures:
             - Directory names should include "PositionTitle - CompanyName [CountryCode] (Status)".
             - A `job_description.txt` file in the directory is used for SubmissionTimestamp.
-        - The parsed data is saved as a CSV file in the OUTPUT_DIR.
-    """
-    job_data = []
-
-    for dirname in os.listdir(directory):
-        dirpath = os.path.join(directory, dirname)
-        if os.path.isdir(dirpath):
-            details = extract_job_details(dirname)
-            if details:
-                job_title, company, country, status = details
-
-                # Extract number of applications
-                num_applications_match = re.search(r"x(\d+)", company)
-                num_applications = (
-                    int(num_applications_match.group(1))
-                    if num_applications_match
-                    else 1
-                )
-                company = re.sub(
-                    r"\sx\d+$", "", company
-                )  # Remove "xN" suffix from company name
-
-                # Check for cover letter
-                has_cover = any(
-                    "cover" in filename.lower() or "motivation" in filename.lower()
-                    for filename in os.listdir(dirpath)
-                )
-
-                # Extract timestamps
-                job_description_file = os.path.join(dirpath, "job_description.txt")
-                if os.path.exists(job_description_file):
-                    submission_timestamp = format_timestamp(
-                        os.stat(job_description_file).st_ctime
-                    )
-                else:
-                    submission_timestamp = None
-
-                last_update_timestamp = format_timestamp(os.stat(dirpath).st_mtime)
-                if not status or status.lower() == "s":
-                    last_update_timestamp = None
-
-                # Append parsed data
-                job_data.append(
-                    (
-                        job_title,
-                        company,
-                        country,
-                        num_applications,
-                        has_cover,
-                        status,
-                        submission_timestamp,
-                        last_update_timestamp,
-                    )
-                )
-            else:
-                print(f"Skipping directory: {dirname}")
-
-    # Create DataFrame
-    parsed_data_df = pd.DataFrame(
-        job_data,
-        columns=[
-            "Position",
-            "Company",
-            "Country",
-            "NumApplications",
-            "HasCover",
-            "Status",
-            "SubmissionTimestamp",
-            "LastUpdateTimestamp",
-        ],
+        - The parsed data is only saved to OUTPUT_DIR when `persist` is True.
+    """
+    cache = load_parse_cache(cache_filepath) if cache_filepath else None
+    chunks = list(
+        iter_job_application_directory(directory, chunk_size or sys.maxsize, cache)
     )
+    if cache_filepath:
+        save_parse_cache(cache, cache_filepath)
 
-    jobhunt_parsed_data_filepath = os.path.join(OUTPUT_DIR, "parsed_data.csv")
+    # Create DataFrame
+    parsed_data_df = (
+        pd.concat(chunks, ignore_index=True) if chunks else _to_frame([])
+    ).astype(PARSED_CATEGORIES)
 
     if parsed_data_df.empty:
         print("No data found. Please check filenames or folder structure.")
-    else:
-        parsed_data_df.to_csv(jobhunt_parsed_data_filepath, index=False)
-        print(f"Data saved to {jobhunt_parsed_data_filepath}")
+    elif persist:
+        save_parsed_data(parsed_data_df)
 
     return parsed_data_df
+
+
+@_log_execution_time
+def save_parsed_data(parsed_data_df, output_dir=OUTPUT_DIR):
+    """
+    Persist parsed job details to the output directory.
+
+    Args:
+        parsed_data_df (pandas.DataFrame): Parsed job details.
+        output_dir (str): Directory to store the parsed data (default: OUTPUT_DIR).
+
+    Returns:
+        str: Path of the written file.
+
+    Notes:
+        - The data is written as `parsed_data.parquet` when pyarrow is available,
+          which keeps column dtypes and reads back much faster than CSV.
+          Otherwise it falls back to `parsed_data.csv`.
+    """
+    if HAS_PYARROW:
+        jobhunt_parsed_data_filepath = os.path.join(output_dir, "parsed_data.parquet")
+        parsed_data_df.to_parquet(jobhunt_parsed_data_filepath, index=False)
+    else:
+        jobhunt_parsed_data_filepath = os.path.join(output_dir, "parsed_data.csv")
+        with open(
+            jobhunt_parsed_data_filepath, "w", newline="", buffering=CSV_BUFFER_SIZE
+        ) as file:
+            parsed_data_df.to_csv(file, index=False)
+
+    print(f"Data saved to {jobhunt_parsed_data_filepath}")
+    return jobhunt_parsed_data_filepath
+
+
+@_log_execution_time
+def save_parsed_data_chunks(chunks, output_dir=OUTPUT_DIR):
+    """
+    Stream chunks of parsed job details to the output directory.
+
+    Unlike `save_parsed_data`, only one chunk is held in memory at a time, which
+    keeps memory flat for very large application directories.
+
+    Args:
+        chunks (Iterable[pandas.DataFrame]): Chunks as yielded by
+            `iter_job_application_directory`.
+        output_dir (str): Directory to store the parsed data (default: OUTPUT_DIR).
+
+    Returns:
+        str: Path of the written file.
+    """
+    if HAS_PYARROW:
+        import pyarrow.parquet as pq
+
+        jobhunt_parsed_data_filepath = os.path.join(output_dir, "parsed_data.parquet")
+        with pq.ParquetWriter(jobhunt_parsed_data_filepath, _PARQUET_SCHEMA) as writer:
+            for chunk_df in chunks:
+                writer.write_table(
+                    pa.Table.from_pandas(
+                        chunk_df, schema=_PARQUET_SCHEMA, preserve_index=False
+                    )
+                )
+    else:
+        jobhunt_parsed_data_filepath = os.path.join(output_dir, "parsed_data.csv")
+        with open(
+            jobhunt_parsed_data_filepath, "w", newline="", buffering=CSV_BUFFER_SIZE
+        ) as file:
+            file.write(",".join(PARSED_COLUMNS) + "\n")
+            for chunk_df in chunks:
+                chunk_df.to_csv(file, index=False, header=False)
+
+    print(f"Data saved to {jobhunt_parsed_data_filepath}")
+    return jobhunt_parsed_data_filepath
+
+
+if __name__ == "__main__":
+    # Refresh the parsed data without holding the whole directory in memory
+    save_parsed_data_chunks(iter_job_application_directory(APPLICATIONS_DIR))
@@ -1,10 +1,8 @@
+from functools import lru_cache
+
 from dash import html, dcc
 import dash_bootstrap_components as dbc
-from dashboard.control_panel import (
-    description_card,
-    generate_control_card,
-    generate_stats_card,
-)
+from dashboard.control_panel import description_card, generate_stats_card
 
 from utils.performance import _log_execution_time
 
@@ -12,32 +10,131 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Header Section
+_HEADER = dbc.Row(
+    [
+        dbc.Col(
+            html.Img(src="./assets/logos/logo.png", className="logo"),
+            width="auto",
+        ),
+        dbc.Col(
+            [
+                html.H1("ATHENA", className="title"),
+                html.H2(
+                    "APPLICATION TRACKING & RECRUITMENT ANALYTICS",
+                    className="subtitle",
+                ),
+            ],
+            style={
+                "display": "flex",
+                "flex-direction": "column",
+                "justify-content": "center",
+            },
+        ),
+    ],
+    align="center",
+    className="mb-4",
+)
+
+# Footer Section
+_FOOTER = html.Footer(
+    [
+        # Icons and email link
+        html.Div(
+            [
+                html.A(
+                    html.I(className="fab fa-linkedin-in"),  # LinkedIn icon
+                    href="https://www.linkedin.com/company/fox-techniques",
+                    target="_blank",
+                    className="footer-icon",
+                ),
+                html.A(
+                    html.I(className="fab fa-github"),  # GitHub icon
+                    href="https://github.com/fox-techniques",
+                    target="_blank",
+                    className="footer-icon",
+                ),
+                html.A(
+                    html.I(className="fas fa-envelope"),  # Email icon
+                    href="mailto:contact@fox-techniques.com?subject=Inquiry%20about%20Fox%20Techniques'%20Solutions%20and%20Services",
+                    className="footer-icon",
+                ),
+            ],
+            className="footer-icons",
+        ),
+        # Footer Text
+        html.Div(
+            [
+                "2025 | ",
+                html.A(
+                    html.Img(
+                        src="assets/logos/fox-techniques-long-logo-light.png",
+                        className="footer-logo",
+                    ),
+                    href="https://www.fox-techniques.com",
+                ),
+            ],
+            className="footer-text",
+        ),
+    ],
+    className="footer",
+)
+
+
+# Stats card titles and icons, in the order of the metrics tuple
+_STATS_SPEC = (
+    ("Applications", "application-icon.png"),
+    ("Countries", "country-icon.png"),
+    ("Industries", "sector-icon.png"),
+    ("Backgrounds", "area-icon.png"),
+    ("Active", "active-icon.png"),
+    ("Interviews", "interview-icon.png"),
+)
+
+# Full width on xs, two per row on sm, grid on larger screens,
+# with spacing for vertical stacking
+_STATS_COL_KW = dict(xs=12, sm=6, md=4, lg=2, className="mb-1")
+
+
+@lru_cache(maxsize=1)
+def generate_stats_cards():
+    """
+    Build the stats cards row, with empty values.
+
+    Each value has the stable pattern-matching ID `{"type": "stats-value", "index": i}`,
+    so a callback only has to send the values themselves.
+
+    Returns:
+        dbc.Row: A row containing one stats card per entry of `_STATS_SPEC`.
+    """
+    return dbc.Row(
+        [
+            dbc.Col(
+                generate_stats_card(title, "", f"./assets/icons/{icon}", index=i),
+                **_STATS_COL_KW,
+            )
+            for i, (title, icon) in enumerate(_STATS_SPEC)
+        ],
+        className="g-3 stats-card-container",  # Adds gutter spacing between rows and columns
+    )
+
 
 @_log_execution_time
-def generate_layout(processed_data_df, metrics, visualizations):
+def generate_layout(visualizations):
     """
     Generate the layout for the ATHENA dashboard.
 
+    The control panel slot and the stats card values are left empty, and filled
+    by a callback once the page has loaded (see `callbacks.load_components`).
+
     Args:
-        processed_data_df (DataFrame): The processed job application data.
-        metrics (tuple): Key metrics extracted from the dataset. Expected order:
-                        (applications, countries, industries, fields, active, interviews).
         visualizations (tuple): Visualizations generated for the dashboard. Expected order:
                                 (industries_chart, fields_chart, choropleth_map, sankey_diagram).
 
     Returns:
         html.Div: The full layout of the ATHENA dashboard.
     """
-    # Unpack metrics and visualizations
-    (
-        num_of_applications,
-        num_of_countries,
-        num_of_industries,
-        num_of_fields,
-        num_of_active,
-        num_of_interviews,
-    ) = metrics
-
+    # Unpack visualizations
     (
         industries_chart,
         fields_chart,
@@ -45,111 +142,6 @@ def generate_layout(processed_data_df, metrics, visualizations):
         sankey_diagram,
     ) = visualizations
 
-    # Header Section
-    header = dbc.Row(
-        [
-            dbc.Col(
-                html.Img(src="./assets/logos/logo.png", className="logo"),
-                width="auto",
-            ),
-            dbc.Col(
-                [
-                    html.H1("ATHENA", className="title"),
-                    html.H2(
-                        "APPLICATION TRACKING & RECRUITMENT ANALYTICS",
-                        className="subtitle",
-                    ),
-                ],
-                style={
-                    "display": "flex",
-                    "flex-direction": "column",
-                    "justify-content": "center",
-                },
-            ),
-        ],
-        align="center",
-        className="mb-4",
-    )
-
-    # Stats Cards Section
-    stats_cards = dbc.Row(
-        [
-            dbc.Col(
-                generate_stats_card(
-                    "Applications",
-                    num_of_applications,
-                    "./assets/icons/application-icon.png",
-                ),
-                xs=12,
-                sm=6,
-                md=4,
-                lg=2,  # Full width on xs, two per row on sm, grid on larger screens
-                className="mb-1",  # Spacing for vertical stacking
-            ),
-            dbc.Col(
-                generate_stats_card(
-                    "Countries",
-                    num_of_countries,
-                    "./assets/icons/country-icon.png",
-                ),
-                xs=12,
-                sm=6,
-                md=4,
-                lg=2,
-                className="mb-1",
-            ),
-            dbc.Col(
-                generate_stats_card(
-                    "Industries",
-                    num_of_industries,
-                    "./assets/icons/sector-icon.png",
-                ),
-                xs=12,
-                sm=6,
-                md=4,
-                lg=2,
-                className="mb-1",
-            ),
-            dbc.Col(
-                generate_stats_card(
-                    "Backgrounds",
-                    num_of_fields,
-                    "./assets/icons/area-icon.png",
-                ),
-                xs=12,
-                sm=6,
-                md=4,
-                lg=2,
-                className="mb-1",
-            ),
-            dbc.Col(
-                generate_stats_card(
-                    "Active",
-                    num_of_active,
-                    "./assets/icons/active-icon.png",
-                ),
-                xs=12,
-                sm=6,
-                md=4,
-                lg=2,
-                className="mb-1",
-            ),
-            dbc.Col(
-                generate_stats_card(
-                    "Interviews",
-                    num_of_interviews,
-                    "./assets/icons/interview-icon.png",
-                ),
-                xs=12,
-                sm=6,
-                md=4,
-                lg=2,
-                className="mb-1",
-            ),
-        ],
-        className="g-3 stats-card-container",  # Adds gutter spacing between rows and columns
-    )
-
     # Visualizations Section
     visualizations_section = dbc.Card(
         [
@@ -161,50 +153,6 @@ def generate_layout(processed_data_df, metrics, visualizations):
         className="graph-card",
     )
 
-    # Footer Section
-    footer = html.Footer(
-        [
-            # Icons and email link
-            html.Div(
-                [
-                    html.A(
-                        html.I(className="fab fa-linkedin-in"),  # LinkedIn icon
-                        href="https://www.linkedin.com/company/fox-techniques",
-                        target="_blank",
-                        className="footer-icon",
-                    ),
-                    html.A(
-                        html.I(className="fab fa-github"),  # GitHub icon
-                        href="https://github.com/fox-techniques",
-                        target="_blank",
-                        className="footer-icon",
-                    ),
-                    html.A(
-                        html.I(className="fas fa-envelope"),  # Email icon
-                        href="mailto:contact@fox-techniques.com?subject=Inquiry%20about%20Fox%20Techniques'%20Solutions%20and%20Services",
-                        className="footer-icon",
-                    ),
-                ],
-                className="footer-icons",
-            ),
-            # Footer Text
-            html.Div(
-                [
-                    "2025 | ",
-                    html.A(
-                        html.Img(
-                            src="assets/logos/fox-techniques-long-logo-light.png",
-                            className="footer-logo",
-                        ),
-                        href="https://www.fox-techniques.com",
-                    ),
-                ],
-                className="footer-text",
-            ),
-        ],
-        className="footer",
-    )
-
     # Content Section
     content = dbc.Row(
         [
@@ -217,7 +165,8 @@ def generate_layout(processed_data_df, metrics, visualizations):
                         id="output-clientside",
                         style={"display": "none"},
                     ),
-                    generate_control_card(processed_data_df),
+                    dcc.Store(id="page-ready"),
+                    dcc.Loading(html.Div(id="control-card-slot"), type="dot"),
                 ],
                 xs=12,
                 sm=12,
@@ -229,7 +178,7 @@ def generate_layout(processed_data_df, metrics, visualizations):
             # Right Column
             dbc.Col(
                 [
-                    stats_cards,
+                    dcc.Loading(generate_stats_cards(), type="dot"),
                     visualizations_section,
                 ],
                 xs=12,
@@ -248,8 +197,8 @@ def generate_layout(processed_data_df, metrics, visualizations):
         [
             dbc.Container(
                 id="app-container",
-                children=[header, content],
+                children=[_HEADER, content],
             ),
-            footer,
+            _FOOTER,
         ]
     )
@@ -6,6 +6,9 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Numeric part of a StatusLevel name, e.g. 12 in "StatusLevel12"
+_LEVEL_NUM_RE = re.compile(r"(\d+)")
+
 
 @_log_execution_time
 def handle_1st_node_for_ir_levels(ir_levels):
@@ -18,10 +21,16 @@ def handle_1st_node_for_ir_levels(ir_levels):
 
     Returns:
         list: The modified list of levels.
+
+    Notes:
+        - Only the first '1st Node' is replaced. The levels come from a
+          multi-select dropdown, which never holds the same value twice.
     """
-    if "1st Node" in ir_levels:
-        return [""] + [level for level in ir_levels if level != "1st Node"]
-    return ir_levels
+    try:
+        index = ir_levels.index("1st Node")
+    except ValueError:
+        return ir_levels
+    return ["", *ir_levels[:index], *ir_levels[index + 1 :]]
 
 
 @_log_execution_time
@@ -50,16 +59,18 @@ def reorder_and_place_status_levels(ir_levels):
     if len(status_levels) > 1:
         # Sort StatusLevel items by the numeric value extracted from their names
         sorted_status_levels = sorted(
-            status_levels, key=lambda x: int(re.search(r"(\d+)", x[1]).group(1))
+            status_levels, key=lambda x: int(_LEVEL_NUM_RE.search(x[1]).group(1))
         )
 
-        # Replace the sorted StatusLevel items back into the original list
-        ir_levels_copy = ir_levels.copy()
-        for (original_index, _), (_, sorted_level) in zip(
-            status_levels, sorted_status_levels
-        ):
-            ir_levels_copy[original_index] = sorted_level
-
-        return ir_levels_copy
+        # Place the sorted StatusLevel items at the original StatusLevel indices
+        index_to_level = {
+            original_index: sorted_level
+            for (original_index, _), (_, sorted_level) in zip(
+                status_levels, sorted_status_levels
+            )
+        }
+        return [
+            index_to_level.get(index, level) for index, level in enumerate(ir_levels)
+        ]
 
     return ir_levels